@@ -12,31 +12,14 @@ What this does (all steps are optional and can be skipped):
 No git required. Works entirely from this repo directory.
 """
 import argparse
+import concurrent.futures
 import json
 import os
-import platform
-import re
 import shutil
 import subprocess
 import sys
+import tempfile
 import textwrap
-import tomllib  # stdlib Python 3.11+; gracefully falls back below
-
-# ---------------------------------------------------------------------------
-# Compatibility shim for tomllib on Python < 3.11
-# ---------------------------------------------------------------------------
-try:
-    import tomllib  # noqa: F811
-except ImportError:
-    try:
-        import tomli as tomllib  # pip install tomli
-    except ImportError:
-        tomllib = None
-
-try:
-    import tomli_w  # pip install tomli-w  (for writing TOML)
-except ImportError:
-    tomli_w = None
 
 HERE = os.path.dirname(os.path.abspath(__file__))
 SKILL_SRC   = os.path.join(HERE, "src", "skill")
@@ -87,6 +70,7 @@ def ask_yn(prompt, default=True):
 # Platform detection
 # ---------------------------------------------------------------------------
 def detect_platform():
+    import platform
     s = platform.system()
     if s == "Darwin":  return "macos"
     if s == "Windows": return "windows"
@@ -101,6 +85,7 @@ def is_wsl():
 
 def windows_path_from_wsl(wsl_path):
     """Convert a WSL path like /mnt/c/... to C:\..."""
+    import re
     m = re.match(r"^/mnt/([a-z])(/.*)$", wsl_path)
     if m:
         return m.group(1).upper() + ":" + m.group(2).replace("/", "\\")
@@ -110,7 +95,19 @@ def windows_path_from_wsl(wsl_path):
 # ---------------------------------------------------------------------------
 # Plugin directory discovery
 # ---------------------------------------------------------------------------
-def find_plugin_dirs_linux_native():
+def list_subdirs(path):
+    """Names of the directories directly under *path* ([] if it can't be read).
+
+    Uses os.scandir so the entry type comes from the directory listing itself
+    instead of a separate stat() per child.
+    """
+    try:
+        with os.scandir(path) as it:
+            return [e.name for e in it if e.is_dir(follow_symlinks=False)]
+    except OSError:
+        return []
+
+def plugin_dir_candidates_linux_native():
     """~/.local/share/roblox/... or ~/.var Flatpak paths."""
     candidates = []
     home = os.path.expanduser("~")
@@ -119,10 +116,10 @@ def find_plugin_dirs_linux_native():
                                    "data", "roblox", "Plugins"))
     # Generic XDG
     candidates.append(os.path.join(home, ".local", "share", "roblox", "Plugins"))
-    return [p for p in candidates if os.path.isdir(p)]
+    return candidates
 
-def find_plugin_dirs_vinegar():
-    """Scan Vinegar / Wine prefixes for the Roblox Plugins folder."""
+def vinegar_users_dirs():
+    """Wine 'users' folders inside the known Vinegar / Wine prefixes."""
     dirs = []
     home = os.path.expanduser("~")
     vinegar_roots = [
@@ -134,45 +131,57 @@ def find_plugin_dirs_vinegar():
             os.path.join("data", "prefixes", "studio", "drive_c"),
             os.path.join("data", "vinegar", "prefixes", "studio", "drive_c"),
         ]:
-            drive_c = os.path.join(root, prefix_sub)
-            if not os.path.isdir(drive_c):
-                continue
-            users_dir = os.path.join(drive_c, "users")
-            if not os.path.isdir(users_dir):
-                continue
-            for user in os.listdir(users_dir):
-                plugins = os.path.join(users_dir, user,
-                                       "AppData", "Local", "Roblox", "Plugins")
-                if os.path.isdir(plugins):
-                    dirs.append(plugins)
+            dirs.append(os.path.join(root, prefix_sub, "users"))
     return dirs
 
-def find_plugin_dirs_macos():
+def plugin_dir_candidates_macos():
     home = os.path.expanduser("~")
-    return [p for p in [
+    return [
         os.path.join(home, "Documents", "Roblox", "Plugins"),
         os.path.join(home, "Library", "Application Support", "Roblox", "Plugins"),
-    ] if os.path.isdir(p)]
+    ]
 
-def find_plugin_dirs_windows():
+def plugin_dir_candidates_windows():
     local = os.environ.get("LOCALAPPDATA", "")
     if not local:
         local = os.path.join(os.path.expanduser("~"), "AppData", "Local")
-    return [p for p in [
+    return [
         os.path.join(local, "Roblox", "Plugins"),
-    ] if os.path.isdir(p)]
+    ]
+
+def probe_plugin_dir(path):
+    return [path] if os.path.isdir(path) else []
+
+def probe_wine_users(users_dir):
+    """Scan one Wine prefix's users folder for the Roblox Plugins folder."""
+    # A missing drive_c or users dir just yields no entries, so the
+    # scandir doubles as the existence check.
+    found = []
+    for user in list_subdirs(users_dir):
+        plugins = os.path.join(users_dir, user,
+                               "AppData", "Local", "Roblox", "Plugins")
+        if os.path.isdir(plugins):
+            found.append(plugins)
+    return found
 
 def find_plugin_dirs():
     plat = detect_platform()
     wsl = is_wsl()
-    found = []
+    probes = []
     if plat == "linux" and not wsl:
-        found += find_plugin_dirs_vinegar()
-        found += find_plugin_dirs_linux_native()
+        probes += [(probe_wine_users, d) for d in vinegar_users_dirs()]
+        probes += [(probe_plugin_dir, p) for p in plugin_dir_candidates_linux_native()]
     elif plat == "macos":
-        found += find_plugin_dirs_macos()
+        probes += [(probe_plugin_dir, p) for p in plugin_dir_candidates_macos()]
     elif plat == "windows" or wsl:
-        found += find_plugin_dirs_windows()
+        probes += [(probe_plugin_dir, p) for p in plugin_dir_candidates_windows()]
+
+    # Each probe is a blocking filesystem round-trip, which is slow on WSL,
+    # NFS homes and Flatpak overlays; run them side by side. map() keeps the
+    # results in platform order.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+        results = pool.map(lambda probe: probe[0](probe[1]), probes)
+        found = [d for dirs in results for d in dirs]
     return list(dict.fromkeys(found))  # deduplicate, preserve order
 
 
@@ -185,6 +194,19 @@ def install_skill(dest):
             warn("Skipped skill installation.")
             return False
         shutil.rmtree(dest)
+
+    # Same filesystem: hardlink the files instead of copying their bytes.
+    parent = os.path.dirname(os.path.abspath(dest))
+    os.makedirs(parent, exist_ok=True)
+    if os.stat(SKILL_SRC).st_dev == os.stat(parent).st_dev:
+        try:
+            shutil.copytree(SKILL_SRC, dest, copy_function=os.link)
+            ok(f"Skill installed → {dest}")
+            info("Files are hardlinked to the repo copy; edits in either place affect both.")
+            return True
+        except OSError:
+            # e.g. exFAT or a bind mount that rejects hardlinks
+            shutil.rmtree(dest, ignore_errors=True)
     shutil.copytree(SKILL_SRC, dest)
     ok(f"Skill installed → {dest}")
     return True
@@ -264,7 +286,67 @@ def register_claude_desktop(server_script_path):
     info("Restart Claude Desktop to pick up the new server.")
 
 # ── Claude Code ─────────────────────────────────────────────────────────────
+def claude_code_config_path():
+    return os.path.join(os.path.expanduser("~"), ".claude.json")
+
+def config_writable(cfg_path):
+    """True if cfg_path (or, when it doesn't exist yet, its folder) is writable."""
+    if os.path.exists(cfg_path):
+        return os.access(cfg_path, os.W_OK)
+    parent = os.path.dirname(cfg_path)
+    try:
+        os.makedirs(parent, exist_ok=True)
+    except OSError:
+        return False
+    return os.access(parent, os.W_OK)
+
+def write_json_atomic(cfg_path, cfg):
+    """
+    Write cfg to a temp file next to cfg_path, then swap it into place, so a
+    crash or a concurrent writer never leaves a truncated config behind.
+    """
+    cfg_path = os.path.realpath(cfg_path)  # keep a symlinked config linked
+    folder = os.path.dirname(cfg_path)
+    fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=".tmp-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(cfg, f, indent=2, ensure_ascii=False)
+        if os.path.exists(cfg_path):
+            shutil.copymode(cfg_path, tmp_path)
+        os.replace(tmp_path, cfg_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
 def register_claude_code(server_script_path):
+    # Editing the user-scope config directly avoids paying the CLI's runtime
+    # start-up just to add one JSON entry. Only an existing config with the
+    # layout we expect is touched; anything else goes through the CLI.
+    cfg_path = claude_code_config_path()
+    if os.path.isfile(cfg_path) and config_writable(cfg_path):
+        cfg = None
+        with open(cfg_path, encoding="utf-8") as f:
+            try:
+                cfg = json.load(f)
+            except json.JSONDecodeError:
+                pass
+        if isinstance(cfg, dict) and isinstance(cfg.get("mcpServers", {}), dict):
+            servers = cfg.setdefault("mcpServers", {})
+            # Older installs registered the server through the CLI as
+            # 'robloxStudio'.
+            for name in ("roblox-studio-mcp", "robloxStudio"):
+                if name in servers:
+                    warn(f"'{name}' already present in {cfg_path}. Skipping.")
+                    return
+            servers["roblox-studio-mcp"] = {
+                "type": "stdio",
+                "command": python_cmd(),
+                "args": [server_script_path],
+            }
+            write_json_atomic(cfg_path, cfg)
+            ok(f"Registered with Claude Code (user scope) → {cfg_path}")
+            return
+
     if not shutil.which("claude"):
         warn("'claude' CLI not found. Printing the command to run manually:")
         info(f"  claude mcp add roblox-studio-mcp --scope user -- "
@@ -275,7 +357,8 @@ def register_claude_code(server_script_path):
         "--scope", "user", "--",
         python_cmd(), server_script_path,
     ]
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = subprocess.run(cmd, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE, text=True)
     if result.returncode == 0:
         ok("Registered with Claude Code (user scope).")
     else:
@@ -285,7 +368,8 @@ def register_claude_code(server_script_path):
             "args": [server_script_path],
         })
         cmd2 = ["claude", "mcp", "add-json", "robloxStudio", json_blob]
-        r2 = subprocess.run(cmd2, capture_output=True, text=True)
+        r2 = subprocess.run(cmd2, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE, text=True)
         if r2.returncode == 0:
             ok("Registered with Claude Code via add-json.")
         else:
@@ -299,24 +383,40 @@ def codex_config_path():
                                 os.path.join(os.path.expanduser("~"), ".codex"))
     return os.path.join(codex_home, "config.toml")
 
+def codex_entry(server_script_path):
+    """
+    Codex TOML format: [mcp_servers.<name>] with command = "..." and
+    args = [...]. Strings are written as JSON, which is valid TOML basic
+    string syntax (repr() would double Windows backslashes).
+    """
+    return textwrap.dedent(f"""
+        [mcp_servers.roblox-studio-mcp]
+        command = {json.dumps(python_cmd())}
+        args = [{json.dumps(server_script_path)}]
+    """).lstrip()
+
 def register_codex(server_script_path):
     """
     Add [mcp_servers.roblox-studio-mcp] to ~/.codex/config.toml.
-    We prefer 'codex mcp add' CLI but fall back to direct TOML editing.
+    We edit the TOML directly and only fall back to the 'codex mcp add' CLI
+    when the config file can't be written (e.g. a read-only mount).
     """
-    if shutil.which("codex"):
-        cmd = [
-            "codex", "mcp", "add", "robloxStudio", "--",
-            python_cmd(), server_script_path,
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode == 0:
-            ok("Registered with OpenAI Codex via CLI.")
-            return
-
-    # Fall back: edit config.toml manually
     cfg_path = codex_config_path()
-    os.makedirs(os.path.dirname(cfg_path), exist_ok=True)
+    if not config_writable(cfg_path):
+        if shutil.which("codex"):
+            cmd = [
+                "codex", "mcp", "add", "robloxStudio", "--",
+                python_cmd(), server_script_path,
+            ]
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL,
+                                    stderr=subprocess.PIPE, text=True)
+            if result.returncode == 0:
+                ok("Registered with OpenAI Codex via CLI.")
+                return
+        err(f"Cannot write {cfg_path}. Add this entry manually:")
+        for line in codex_entry(server_script_path).splitlines():
+            info(f"  {line}")
+        return
 
     # Read existing TOML (if any)
     existing_text = ""
@@ -324,21 +424,17 @@ def register_codex(server_script_path):
         with open(cfg_path) as f:
             existing_text = f.read()
 
-    # Check for existing entry (avoid duplicates)
-    if "roblox-studio-mcp" in existing_text:
-        warn(f"'roblox-studio-mcp' already present in {cfg_path}. Skipping.")
-        return
-
-    # Codex TOML format: [mcp_servers.<name>]  command = [...]
-    entry = textwrap.dedent(f"""
-        [mcp_servers.roblox-studio-mcp]
-        command = [{python_cmd()!r}, {server_script_path!r}]
-    """).lstrip()
+    # Check for existing entry (avoid duplicates); older installs registered
+    # the server through the CLI as 'robloxStudio'.
+    for name in ("roblox-studio-mcp", "robloxStudio"):
+        if name in existing_text:
+            warn(f"'{name}' already present in {cfg_path}. Skipping.")
+            return
 
     with open(cfg_path, "a") as f:
         if existing_text and not existing_text.endswith("\n"):
             f.write("\n")
-        f.write(entry)
+        f.write(codex_entry(server_script_path))
     ok(f"OpenAI Codex config updated → {cfg_path}")
     info("Restart Codex to pick up the new server.")
 
@@ -4,228 +4,568 @@ Roblox Studio MCP Bridge Server v0.6
 - Rich type support (Color3, Vector3, CFrame, etc.)
 - ScriptEditorService integration (open/close/list scripts)
 - ChangeHistoryService integration (undo/redo/waypoints)
-- ThreadingHTTPServer for concurrent requests
+- Thread-pool HTTP server for concurrent requests
 - Short server-side poll timeout
-- UUID-based job IDs
+- Counter-based job IDs with a random per-process prefix
 - NEW v0.6: Bulk tools (bulk_create_instances, bulk_set_properties, bulk_delete_instances,
              find_and_replace_in_scripts)
 """
-import argparse
+import gc
+import itertools
 import json
+import queue
+import secrets
+import socket
 import sys
 import threading
 import time
-import uuid
+from collections import deque
+from email.utils import formatdate
+from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, HTTPServer
-from socketserver import ThreadingMixIn
-from urllib.parse import parse_qs, urlparse
+from types import SimpleNamespace
+from urllib.parse import unquote_plus
+
+try:
+    import orjson  # pip install orjson  (optional, much faster JSON)
+except ImportError:
+    orjson = None
 
 DEFAULT_CLIENT_ID = "studio"
 DEFAULT_HTTP_PORT = 28650
 DEFAULT_HTTP_BIND = ""
 DEFAULT_POLL_TIMEOUT_SEC = 5
 DEFAULT_JOB_TIMEOUT_SEC = 30
+# Bridge handler threads spend their life blocked in JobQueue waits, so they
+# don't need the platform's default (often 8 MB) thread stack.
+HANDLER_THREAD_STACK_SIZE = 1024 * 1024
+# Cap on concurrent bridge connections being served (each kept-alive plugin
+# connection occupies one worker while it is open).
+MAX_HANDLER_THREADS = 64
+# Read buffer for MCP messages on stdin.
+STDIN_BUFFER_SIZE = 1024 * 1024
+# gc thresholds for the long-running server; gen 0 is raised well above the
+# default 700 so transient bulk-tool dicts don't trigger constant collections.
+GC_THRESHOLDS = (50_000, 20, 10)
+# Number of independently locked JobQueue shards.
+JOB_QUEUE_SHARDS = 16
+# Upper bound on jobs handed out by one /poll when the plugin asks for a batch.
+MAX_POLL_BATCH = 32
+
+
+if orjson is not None:
+    def _json_dumps(payload) -> bytes:
+        return orjson.dumps(payload)
+
+    def _json_dumps_pretty(payload) -> str:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(payload) -> bytes:
+        return json.dumps(payload).encode("utf-8")
+
+    def _json_dumps_pretty(payload) -> str:
+        return json.dumps(payload, ensure_ascii=False, indent=2)
+
+    _json_loads = json.loads  # accepts bytes as well as str
+
+
+# Fixed response bodies, encoded once.
+_OK_EMPTY = _json_dumps({"ok": True})
+_POLL_NO_JOB = _json_dumps({"ok": True, "job": None})
+_ERR_NOT_FOUND = _json_dumps({"ok": False, "error": "not_found"})
+_ERR_INVALID_JSON = _json_dumps({"ok": False, "error": "invalid_json"})
+_ERR_MISSING_JOB_ID = _json_dumps({"ok": False, "error": "missing_job_id"})
+
+_response_heads: dict[int, bytes] = {}
+_date_cache = (0, b"")
+
+
+def _http_date() -> bytes:
+    """The Date header value, formatted at most once per second."""
+    global _date_cache
+    now = int(time.time())
+    if _date_cache[0] != now:
+        _date_cache = (now, formatdate(now, usegmt=True).encode("ascii"))
+    return _date_cache[1]
+
+
+def _split_path(path: str):
+    """Split a request target into (path, query) without urlparse."""
+    qpos = path.find("?")
+    if qpos == -1:
+        return path, ""
+    return path[:qpos], path[qpos + 1:]
+
+
+def _query_param(query: str, key: str, default=None):
+    """Return the first value of `key` in a query string, or `default`.
+
+    A direct scan for the one or two parameters the bridge reads; /poll
+    fires every few seconds per client and parse_qs would build dicts and
+    lists for the whole query each time.
+    """
+    if not query:
+        return default
+    prefix = key + "="
+    start = 0
+    while True:
+        i = query.find(prefix, start)
+        if i == -1:
+            return default
+        if i == 0 or query[i - 1] == "&":
+            break
+        start = i + 1
+    i += len(prefix)
+    j = query.find("&", i)
+    value = query[i:] if j == -1 else query[i:j]
+    if "%" in value or "+" in value:
+        value = unquote_plus(value)
+    return value
 
 
 def _json_response(handler, status, payload):
-    data = json.dumps(payload).encode("utf-8")
-    handler.send_response(status)
-    handler.send_header("Content-Type", "application/json")
-    handler.send_header("Content-Length", str(len(data)))
-    handler.end_headers()
-    handler.wfile.write(data)
+    _json_response_bytes(handler, status, _json_dumps(payload))
+
+
+def _json_response_bytes(handler, status, data: bytes):
+    """Write a complete JSON response (status line, headers, body) at once.
+
+    Bypasses send_response/send_header, which format every header
+    separately; the constant part of the head is built once per status.
+    """
+    head = _response_heads.get(status)
+    if head is None:
+        head = _response_heads[status] = (
+            "%s %d %s\r\nServer: %s\r\nContent-Type: application/json\r\n"
+            % (handler.protocol_version, status, HTTPStatus(status).phrase,
+               handler.server_version)
+        ).encode("latin-1")
+    handler.log_request(status)
+    handler.wfile.write(
+        b"%sDate: %s\r\nContent-Length: %d\r\n%s\r\n%s"
+        % (head, _http_date(), len(data),
+           b"Connection: close\r\n" if handler.close_connection else b"",
+           data)
+    )
+
+
+class _Shard:
+    """One slice of JobQueue state, guarded by its own lock.
+
+    Client-keyed state (pending jobs, poll waiters) lives in the shard picked
+    by the client id; job-keyed state (results, result waiters) in the shard
+    picked by the job id. No operation ever holds two shard locks.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pending: dict[str, deque[dict]] = {}
+        self.job_index: dict[str, dict] = {}
+        self.job_cvs: dict[str, threading.Condition] = {}
+        self.results: dict[str, dict] = {}
+        self.result_cvs: dict[str, threading.Condition] = {}
 
 
 class JobQueue:
-    """Thread-safe job queue with per-client pending lists and result storage."""
+    """Thread-safe job queue with per-client pending lists and result storage.
+
+    State is split across JOB_QUEUE_SHARDS independently locked shards, and
+    waiters sleep on per-client and per-job conditions, so an enqueue or a
+    result only contends with (and wakes) the threads that care about it.
+    """
 
     def __init__(self):
-        self._pending: dict[str, list[dict]] = {}
-        self._results: dict[str, dict] = {}
+        self._shards = [_Shard() for _ in range(JOB_QUEUE_SHARDS)]
         self._last_seen: dict[str, float] = {}
-        self._cv = threading.Condition()
+        # Liveness is updated on every poll/ping and nobody waits on it, so
+        # it gets its own lock instead of contending with the job queues.
+        self._seen_lock = threading.Lock()
+
+    def _shard(self, key: str) -> _Shard:
+        return self._shards[hash(key) % JOB_QUEUE_SHARDS]
 
     def mark_seen(self, client_id: str):
-        with self._cv:
-            self._last_seen[client_id] = time.time()
-            self._cv.notify_all()
+        now = time.monotonic()
+        with self._seen_lock:
+            self._last_seen[client_id] = now
 
     def get_last_seen(self, client_id: str):
-        with self._cv:
+        """time.monotonic() of the client's last poll/ping, or None."""
+        with self._seen_lock:
             return self._last_seen.get(client_id)
 
     def is_connected(self, client_id: str, max_age: float = 15.0) -> bool:
-        with self._cv:
-            last = self._last_seen.get(client_id)
-            if last is None:
-                return False
-            return (time.time() - last) < max_age
+        last = self.get_last_seen(client_id)
+        if last is None:
+            return False
+        return (time.monotonic() - last) < max_age
 
     def enqueue(self, client_id: str, job: dict):
-        with self._cv:
-            self._pending.setdefault(client_id, []).append(job)
-            self._cv.notify_all()
+        shard = self._shard(client_id)
+        with shard.lock:
+            shard.pending.setdefault(client_id, deque()).append(job)
+            shard.job_index[job["job_id"]] = job
+            cv = shard.job_cvs.get(client_id)
+            if cv is not None:
+                cv.notify()
 
     def wait_for_job(self, client_id: str, timeout_sec: float):
-        deadline = time.time() + timeout_sec
-        with self._cv:
+        deadline = time.monotonic() + timeout_sec
+        shard = self._shard(client_id)
+        with shard.lock:
+            cv = shard.job_cvs.get(client_id)
+            if cv is None:
+                cv = shard.job_cvs[client_id] = threading.Condition(shard.lock)
             while True:
-                queue = self._pending.get(client_id)
-                if queue:
-                    return queue.pop(0)
-                remaining = deadline - time.time()
+                pending = shard.pending.get(client_id)
+                if pending:
+                    job = pending.popleft()
+                    shard.job_index.pop(job["job_id"], None)
+                    return job
+                remaining = deadline - time.monotonic()
                 if remaining <= 0:
                     return None
-                self._cv.wait(timeout=remaining)
+                cv.wait(timeout=remaining)
+
+    def drain(self, client_id: str, max_n: int) -> list[dict]:
+        """Pop up to max_n already-queued jobs for a client without waiting."""
+        shard = self._shard(client_id)
+        with shard.lock:
+            pending = shard.pending.get(client_id)
+            jobs = []
+            while pending and len(jobs) < max_n:
+                job = pending.popleft()
+                shard.job_index.pop(job["job_id"], None)
+                jobs.append(job)
+            return jobs
 
     def store_result(self, job_id: str, result: dict):
-        with self._cv:
-            self._results[job_id] = result
-            self._cv.notify_all()
+        shard = self._shard(job_id)
+        with shard.lock:
+            shard.results[job_id] = result
+            cv = shard.result_cvs.get(job_id)
+            if cv is not None:
+                cv.notify()
 
     def wait_for_result(self, job_id: str, timeout_sec: float):
-        deadline = time.time() + timeout_sec
-        with self._cv:
-            while True:
-                if job_id in self._results:
-                    return self._results.pop(job_id)
-                remaining = deadline - time.time()
-                if remaining <= 0:
-                    return None
-                self._cv.wait(timeout=remaining)
-
-    def cancel_job(self, job_id: str):
-        with self._cv:
-            for client_id, queue in self._pending.items():
-                for i, job in enumerate(queue):
-                    if job.get("job_id") == job_id:
-                        queue.pop(i)
-                        return True
-            return False
+        deadline = time.monotonic() + timeout_sec
+        shard = self._shard(job_id)
+        with shard.lock:
+            cv = shard.result_cvs[job_id] = threading.Condition(shard.lock)
+            try:
+                while True:
+                    if job_id in shard.results:
+                        return shard.results.pop(job_id)
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return None
+                    cv.wait(timeout=remaining)
+            finally:
+                del shard.result_cvs[job_id]
+
+    def cancel_job(self, client_id: str, job_id: str):
+        shard = self._shard(client_id)
+        with shard.lock:
+            job = shard.job_index.pop(job_id, None)
+            if job is None:
+                return False
+            shard.pending[client_id].remove(job)
+            return True
 
 
 class RobloxBridgeHttpHandler(BaseHTTPRequestHandler):
     server_version = "RobloxMcpBridge/0.6"
+    # Keep the plugin's connection open between polls instead of paying a
+    # TCP handshake per request; idle connections are dropped after a minute.
+    protocol_version = "HTTP/1.1"
+    timeout = 60
+
+    def parse_request(self):
+        if not super().parse_request():
+            return False
+        # Connections served outside the worker pool get one request only,
+        # so they can't tie up extra threads while idle.
+        if not self.server.keep_alive_allowed(self.connection):
+            self.close_connection = True
+        return True
 
     def do_GET(self):
-        parsed = urlparse(self.path)
-
-        if parsed.path == "/poll":
-            qs = parse_qs(parsed.query or "")
-            client_id = (qs.get("client_id") or [DEFAULT_CLIENT_ID])[0]
-            self.server.job_queue.mark_seen(client_id)
-            job = self.server.job_queue.wait_for_job(
-                client_id, self.server.poll_timeout_sec
-            )
-            _json_response(self, 200, {"ok": True, "job": job})
+        path, query = _split_path(self.path)
+        route = self._get_routes.get(path)
+        if route is None:
+            _json_response_bytes(self, 404, _ERR_NOT_FOUND)
             return
+        route(self, query)
 
-        if parsed.path == "/ping":
-            qs = parse_qs(parsed.query or "")
-            client_id = (qs.get("client_id") or [DEFAULT_CLIENT_ID])[0]
-            self.server.job_queue.mark_seen(client_id)
-            _json_response(self, 200, {"ok": True, "server_time": time.time()})
+    def _get_poll(self, query):
+        client_id = _query_param(query, "client_id") or DEFAULT_CLIENT_ID
+        self.server.job_queue.mark_seen(client_id)
+        try:
+            max_jobs = int(_query_param(query, "max_jobs", "1"))
+        except ValueError:
+            max_jobs = 1
+        if max_jobs > 1:
+            # Plugins that understand "jobs" get everything already queued
+            # (up to the cap) in one response instead of one poll per job.
+            _json_response(self, 200, self._poll_batch(client_id, max_jobs))
             return
-
-        if parsed.path == "/health":
-            _json_response(self, 200, {"ok": True, "uptime": time.time()})
+        job = self.server.job_queue.wait_for_job(
+            client_id, self.server.poll_timeout_sec
+        )
+        if job is None:
+            _json_response_bytes(self, 200, _POLL_NO_JOB)
             return
+        _json_response(self, 200, {"ok": True, "job": job})
+
+    def _get_ping(self, query):
+        client_id = _query_param(query, "client_id") or DEFAULT_CLIENT_ID
+        self.server.job_queue.mark_seen(client_id)
+        _json_response(self, 200, {"ok": True, "server_time": time.time()})
 
-        _json_response(self, 404, {"ok": False, "error": "not_found"})
+    def _get_health(self, query):
+        _json_response(self, 200, {"ok": True, "uptime": time.time()})
+
+    _get_routes = {
+        "/poll": _get_poll,
+        "/ping": _get_ping,
+        "/health": _get_health,
+    }
+
+    def _poll_batch(self, client_id, max_jobs):
+        job_queue = self.server.job_queue
+        max_jobs = min(max_jobs, MAX_POLL_BATCH)
+        jobs = job_queue.drain(client_id, max_jobs)
+        if not jobs:
+            job = job_queue.wait_for_job(client_id, self.server.poll_timeout_sec)
+            if job is not None:
+                jobs = [job] + job_queue.drain(client_id, max_jobs - 1)
+        # "job" mirrors the first entry so the response is still readable by
+        # code that only knows the single-job shape.
+        return {"ok": True, "job": jobs[0] if jobs else None, "jobs": jobs}
 
     def do_POST(self):
-        parsed = urlparse(self.path)
-        if parsed.path != "/result":
-            _json_response(self, 404, {"ok": False, "error": "not_found"})
+        path, _ = _split_path(self.path)
+        if path != "/result":
+            # The body is left unread, so the connection can't be reused.
+            self.close_connection = True
+            _json_response_bytes(self, 404, _ERR_NOT_FOUND)
             return
 
         length = int(self.headers.get("Content-Length", "0") or "0")
-        raw = self.rfile.read(length) if length else b"{}"
+        raw = self._read_body(length) if length else b"{}"
         try:
-            payload = json.loads(raw.decode("utf-8"))
-        except json.JSONDecodeError:
-            _json_response(self, 400, {"ok": False, "error": "invalid_json"})
+            payload = _json_loads(raw)
+        except ValueError:  # also covers invalid UTF-8
+            _json_response_bytes(self, 400, _ERR_INVALID_JSON)
             return
 
         job_id = payload.get("job_id")
         if not job_id:
-            _json_response(self, 400, {"ok": False, "error": "missing_job_id"})
+            _json_response_bytes(self, 400, _ERR_MISSING_JOB_ID)
             return
 
         self.server.job_queue.store_result(job_id, payload)
-        _json_response(self, 200, {"ok": True})
+        _json_response_bytes(self, 200, _OK_EMPTY)
+
+    def _read_body(self, length: int) -> bytearray:
+        """Read exactly `length` body bytes into one preallocated buffer.
+
+        Large results (e.g. terrain voxel dumps) are parsed straight from
+        this buffer, without intermediate bytes/str copies. A truncated body
+        comes back short and fails JSON parsing.
+        """
+        buf = bytearray(length)
+        view = memoryview(buf)
+        n = 0
+        while n < length:
+            got = self.rfile.readinto(view[n:])
+            if not got:
+                del view
+                del buf[n:]
+                break
+            n += got
+        return buf
 
     def log_message(self, fmt, *args):
         if not self.server.quiet:
             super().log_message(fmt, *args)
 
 
-class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
-    daemon_threads = True
+class ThreadPoolHTTPServer(HTTPServer):
+    """HTTPServer that serves connections on a bounded set of reused threads.
+
+    ThreadingMixIn starts a fresh thread per connection with no upper limit.
+    Here worker threads are started on demand up to max_workers and then
+    reused. Workers stay with a kept-alive connection while it is idle, so
+    once all of them are busy a new connection is not queued behind them:
+    it gets a short-lived thread of its own and is closed after a single
+    request. Workers are daemon threads (unlike ThreadPoolExecutor's), so a
+    long poll or an idle kept-alive connection never holds up process exit.
+    """
 
+    # Listen backlog; socketserver's default of 5 drops connects in bursts.
+    request_queue_size = 128
 
-class RobloxBridgeHttpServer(ThreadingHTTPServer):
+    def __init__(self, addr, handler, max_workers=MAX_HANDLER_THREADS):
+        super().__init__(addr, handler)
+        self._max_workers = max_workers
+        self._requests = queue.SimpleQueue()
+        self._workers_lock = threading.Lock()
+        self._num_workers = 0
+        # Idle workers not yet claimed by a queued request.
+        self._idle_workers = 0
+        # Connections served outside the pool; they don't get keep-alive.
+        self._overflow = set()
+
+    def process_request(self, request, client_address):
+        with self._workers_lock:
+            if self._idle_workers > 0:
+                self._idle_workers -= 1
+            elif self._num_workers < self._max_workers:
+                self._num_workers += 1
+                threading.Thread(
+                    target=self._worker,
+                    name=f"bridge-{self._num_workers}",
+                    daemon=True,
+                ).start()
+            else:
+                self._overflow.add(request)
+                threading.Thread(
+                    target=self._serve_overflow,
+                    args=(request, client_address),
+                    daemon=True,
+                ).start()
+                return
+        self._requests.put((request, client_address))
+
+    def keep_alive_allowed(self, request) -> bool:
+        return request not in self._overflow
+
+    def _serve_overflow(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self._overflow.discard(request)
+            self.shutdown_request(request)
+
+    def _worker(self):
+        while True:
+            request, client_address = self._requests.get()
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+            with self._workers_lock:
+                self._idle_workers += 1
+
+
+class RobloxBridgeHttpServer(ThreadPoolHTTPServer):
     def __init__(self, addr, handler, job_queue, poll_timeout_sec, quiet):
         super().__init__(addr, handler)
         self.job_queue = job_queue
         self.poll_timeout_sec = poll_timeout_sec
         self.quiet = quiet
 
+    def get_request(self):
+        # Responses are small JSON messages; don't let Nagle hold them back
+        # waiting for an ACK on a kept-alive connection.
+        request, client_address = super().get_request()
+        request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return request, client_address
+
 
 class McpServer:
-    def __init__(self, job_queue: JobQueue, job_timeout_sec: int):
+    def __init__(self, job_queue: JobQueue, job_timeout_sec: int,
+                 validate_input: bool = True):
         self.job_queue = job_queue
         self.job_timeout_sec = job_timeout_sec
+        self.validate_input = validate_input
+        # Set once the client sends a Content-Length framed message; replies
+        # then use the same framing instead of newline-delimited JSON.
+        self.framed = False
+        self._methods = {
+            "initialize": self._m_initialize,
+            "notifications/initialized": self._m_initialized,
+            "tools/list": self._m_tools_list,
+            "tools/call": self._m_tools_call,
+        }
 
     def run(self):
-        for line in sys.stdin:
-            line = line.strip()
-            if not line:
+        # Read raw bytes through a large buffer: big tools/call arguments
+        # arrive in a few reads and are never decoded to str line by line.
+        stdin = open(sys.stdin.fileno(), "rb", buffering=STDIN_BUFFER_SIZE,
+                     closefd=False)
+        while True:
+            body = self._read_message(stdin)
+            if body is None:
+                break
+            if not body:
                 continue
             try:
-                msg = json.loads(line)
-            except json.JSONDecodeError:
+                msg = _json_loads(body)
+            except ValueError:
                 continue
 
             if "method" in msg:
                 self._handle_request(msg)
 
-    def _send(self, payload):
-        sys.stdout.write(json.dumps(payload) + "\n")
-        sys.stdout.flush()
-
-    def _handle_request(self, msg):
-        method = msg.get("method")
-        msg_id = msg.get("id")
+    def _read_message(self, stdin):
+        """Read one message body; None at EOF.
 
-        if method == "initialize":
-            result = {
-                "protocolVersion": "2024-11-05",
-                "serverInfo": {
-                    "name": "roblox-mcp-bridge",
-                    "version": "0.6",
-                },
-                "capabilities": {"tools": {}},
-            }
-            self._send({"jsonrpc": "2.0", "id": msg_id, "result": result})
-            return
+        Accepts newline-delimited JSON as well as LSP-style
+        'Content-Length: N' framing, where the body is read in one go
+        instead of being scanned for the end of the line.
+        """
+        line = stdin.readline()
+        if not line:
+            return None
+        if line[:15].lower() != b"content-length:":
+            return line.strip()
 
-        if method == "notifications/initialized":
-            return
+        try:
+            length = int(line[15:].strip())
+        except ValueError:
+            return b""
+        if length < 0:  # read(-1) would block until EOF
+            return b""
+        while True:  # skip any remaining headers up to the blank line
+            header = stdin.readline()
+            if not header:
+                return None
+            if not header.strip():
+                break
+        self.framed = True
+        return stdin.read(length)
 
-        if method == "tools/list":
-            tools = _build_tools()
-            self._send({"jsonrpc": "2.0", "id": msg_id, "result": {"tools": tools}})
-            return
+    def _send(self, payload):
+        self._send_raw(_json_dumps(payload))
+
+    def _send_raw(self, *chunks: bytes):
+        # Write the pieces straight into the buffered stdout rather than
+        # concatenating them, so large payloads aren't copied just to
+        # append the newline.
+        out = sys.stdout.buffer
+        if self.framed:
+            out.write(b"Content-Length: %d\r\n\r\n" % sum(map(len, chunks)))
+        for chunk in chunks:
+            out.write(chunk)
+        if not self.framed:
+            out.write(b"\n")
+        out.flush()
 
-        if method == "tools/call":
-            params = msg.get("params") or {}
-            name = params.get("name")
-            arguments = params.get("arguments") or {}
-            result = self._call_tool(name, arguments)
-            self._send({"jsonrpc": "2.0", "id": msg_id, "result": result})
+    def _handle_request(self, msg):
+        handler = self._methods.get(msg.get("method"))
+        if handler is not None:
+            handler(msg)
             return
 
+        msg_id = msg.get("id")
         if msg_id is not None:
             self._send(
                 {
@@ -235,9 +575,50 @@ class McpServer:
                 }
             )
 
+    def _m_initialize(self, msg):
+        result = {
+            "protocolVersion": "2024-11-05",
+            "serverInfo": {
+                "name": "roblox-mcp-bridge",
+                "version": "0.6",
+            },
+            "capabilities": {"tools": {}},
+        }
+        self._send({"jsonrpc": "2.0", "id": msg.get("id"), "result": result})
+
+    def _m_initialized(self, msg):
+        pass
+
+    def _m_tools_list(self, msg):
+        self._send_raw(
+            _TOOLS_LIST_PREFIX, _json_dumps(msg.get("id")), _TOOLS_LIST_SUFFIX
+        )
+
+    def _m_tools_call(self, msg):
+        params = msg.get("params") or {}
+        name = params.get("name")
+        arguments = params.get("arguments") or {}
+        result = self._call_tool(name, arguments)
+        self._send({"jsonrpc": "2.0", "id": msg.get("id"), "result": result})
+
     def _call_tool(self, name, arguments):
-        if name == "studio_get_connection_status":
-            return _tool_result(_get_connection_status(self.job_queue, arguments))
+        if not isinstance(arguments, dict):
+            return _tool_error(
+                f"Invalid arguments for {name}: arguments must be of type object"
+            )
+        if self.validate_input:
+            validate = _VALIDATORS.get(name)
+            if validate is not None:
+                try:
+                    validate(arguments, "arguments")
+                except ValueError as e:
+                    return _tool_error(f"Invalid arguments for {name}: {e}")
+
+        job_type = _TOOL_TO_JOB.get(name)
+        if job_type is None:
+            if name == "studio_get_connection_status":
+                return _tool_result(_get_connection_status(self.job_queue, arguments))
+            return _tool_error(f"Unknown tool: {name}")
 
         client_id = arguments.get("client_id") or DEFAULT_CLIENT_ID
         if not self.job_queue.is_connected(client_id):
@@ -246,16 +627,13 @@ class McpServer:
                 "is installed and 'Start Bridge Polling' has been clicked."
             )
 
-        job = _build_job(name, arguments)
-        if job is None:
-            return _tool_error(f"Unknown tool: {name}")
-
+        job = _build_job(job_type, arguments)
         job_id = job["job_id"]
         self.job_queue.enqueue(client_id, job)
         result = self.job_queue.wait_for_result(job_id, self.job_timeout_sec)
 
         if result is None:
-            self.job_queue.cancel_job(job_id)
+            self.job_queue.cancel_job(client_id, job_id)
             return _tool_error(
                 "Timed out waiting for Studio to respond. "
                 "Check that the plugin is running and connected."
@@ -268,7 +646,7 @@ class McpServer:
 
 
 def _tool_result(payload):
-    text = json.dumps(payload, ensure_ascii=False, indent=2)
+    text = _json_dumps_pretty(payload)
     return {"content": [{"type": "text", "text": text}]}
 
 
@@ -276,84 +654,92 @@ def _tool_error(message):
     return {"isError": True, "content": [{"type": "text", "text": message}]}
 
 
-def _build_job(name, arguments):
-    job_id = f"job_{uuid.uuid4().hex[:12]}"
-    tool_to_job = {
-        # Instance tools
-        "roblox_list_services": "list_services",
-        "roblox_get_children": "get_children",
-        "roblox_get_descendants": "get_descendants",
-        "roblox_get_instance": "get_instance",
-        "roblox_find_instances": "find_instances",
-        "roblox_create_instance": "create_instance",
-        "roblox_delete_instance": "delete_instance",
-        "roblox_clone_instance": "clone_instance",
-        "roblox_reparent_instance": "reparent_instance",
-        "roblox_set_name": "set_name",
-        "roblox_select_instance": "select_instance",
-        "roblox_get_tree": "get_tree",
-        # Property / Attribute tools
-        "roblox_get_attributes": "get_attributes",
-        "roblox_set_attributes": "set_attributes",
-        "roblox_get_properties": "get_properties",
-        "roblox_set_properties": "set_properties",
-        # Tag tools
-        "roblox_get_tags": "get_tags",
-        "roblox_add_tag": "add_tag",
-        "roblox_remove_tag": "remove_tag",
-        # Script tools
-        "roblox_read_script": "read_script",
-        "roblox_write_script": "write_script",
-        "roblox_patch_script": "patch_script",
-        "roblox_get_script_lines": "get_script_lines",
-        "roblox_search_script": "search_script",
-        "roblox_get_script_functions": "get_script_functions",
-        "roblox_search_across_scripts": "search_across_scripts",
-        # Selection
-        "roblox_get_selection": "get_selection",
-        # ScriptEditorService
-        "roblox_open_script": "open_script",
-        "roblox_get_open_scripts": "get_open_scripts",
-        "roblox_close_script": "close_script",
-        # ChangeHistoryService
-        "roblox_undo": "undo",
-        "roblox_redo": "redo",
-        "roblox_set_waypoint": "set_waypoint",
-        "roblox_get_all_properties": "get_all_properties",
-        "roblox_run_code": "run_code",
-        "roblox_insert_model": "insert_model",
-        "roblox_get_console_output": "get_console_output",
-        "roblox_start_stop_play": "start_stop_play",
-        "roblox_run_script_in_play_mode": "run_script_in_play_mode",
-        "roblox_get_studio_mode": "get_studio_mode",
-        # ── NEW v0.6: Terrain tools ────────────────────────────────────────
-        "roblox_terrain_fill_block":       "terrain_fill_block",
-        "roblox_terrain_fill_ball":        "terrain_fill_ball",
-        "roblox_terrain_fill_cylinder":    "terrain_fill_cylinder",
-        "roblox_terrain_replace_material": "terrain_replace_material",
-        "roblox_terrain_read_voxels":      "terrain_read_voxels",
-        "roblox_terrain_clear_region":     "terrain_clear_region",
-        # ── NEW v0.6: Bulk tools ───────────────────────────────────────────
-        "roblox_bulk_create_instances":        "bulk_create_instances",
-        "roblox_bulk_set_properties":          "bulk_set_properties",
-        "roblox_bulk_delete_instances":        "bulk_delete_instances",
-        "roblox_find_and_replace_in_scripts":  "find_and_replace_in_scripts",
-        # ── NEW v0.6: DataModel tools ──────────────────────────────────────
-        "roblox_get_place_info":       "get_place_info",
-        "roblox_set_lighting":         "set_lighting",
-        "roblox_get_workspace_info":   "get_workspace_info",
-        "roblox_get_team_list":        "get_team_list",
-        "roblox_get_lighting_effects": "get_lighting_effects",
-    }
+# Job IDs only have to be unique among the jobs this process has in flight:
+# a random per-process prefix plus a counter avoids a urandom read and a UUID
+# object per tool call.
+_JOB_ID_PREFIX = secrets.token_hex(3)
+_job_counter = itertools.count()
+
+_TOOL_TO_JOB = {
+    # Instance tools
+    "roblox_list_services": "list_services",
+    "roblox_get_children": "get_children",
+    "roblox_get_descendants": "get_descendants",
+    "roblox_get_instance": "get_instance",
+    "roblox_find_instances": "find_instances",
+    "roblox_create_instance": "create_instance",
+    "roblox_delete_instance": "delete_instance",
+    "roblox_clone_instance": "clone_instance",
+    "roblox_reparent_instance": "reparent_instance",
+    "roblox_set_name": "set_name",
+    "roblox_select_instance": "select_instance",
+    "roblox_get_tree": "get_tree",
+    # Property / Attribute tools
+    "roblox_get_attributes": "get_attributes",
+    "roblox_set_attributes": "set_attributes",
+    "roblox_get_properties": "get_properties",
+    "roblox_set_properties": "set_properties",
+    # Tag tools
+    "roblox_get_tags": "get_tags",
+    "roblox_add_tag": "add_tag",
+    "roblox_remove_tag": "remove_tag",
+    # Script tools
+    "roblox_read_script": "read_script",
+    "roblox_write_script": "write_script",
+    "roblox_patch_script": "patch_script",
+    "roblox_get_script_lines": "get_script_lines",
+    "roblox_search_script": "search_script",
+    "roblox_get_script_functions": "get_script_functions",
+    "roblox_search_across_scripts": "search_across_scripts",
+    # Selection
+    "roblox_get_selection": "get_selection",
+    # ScriptEditorService
+    "roblox_open_script": "open_script",
+    "roblox_get_open_scripts": "get_open_scripts",
+    "roblox_close_script": "close_script",
+    # ChangeHistoryService
+    "roblox_undo": "undo",
+    "roblox_redo": "redo",
+    "roblox_set_waypoint": "set_waypoint",
+    "roblox_get_all_properties": "get_all_properties",
+    "roblox_run_code": "run_code",
+    "roblox_insert_model": "insert_model",
+    "roblox_get_console_output": "get_console_output",
+    "roblox_start_stop_play": "start_stop_play",
+    "roblox_run_script_in_play_mode": "run_script_in_play_mode",
+    "roblox_get_studio_mode": "get_studio_mode",
+    # ── NEW v0.6: Terrain tools ────────────────────────────────────────────
+    "roblox_terrain_fill_block":       "terrain_fill_block",
+    "roblox_terrain_fill_ball":        "terrain_fill_ball",
+    "roblox_terrain_fill_cylinder":    "terrain_fill_cylinder",
+    "roblox_terrain_replace_material": "terrain_replace_material",
+    "roblox_terrain_read_voxels":      "terrain_read_voxels",
+    "roblox_terrain_clear_region":     "terrain_clear_region",
+    # ── NEW v0.6: Bulk tools ───────────────────────────────────────────────
+    "roblox_bulk_create_instances":        "bulk_create_instances",
+    "roblox_bulk_set_properties":          "bulk_set_properties",
+    "roblox_bulk_delete_instances":        "bulk_delete_instances",
+    "roblox_find_and_replace_in_scripts":  "find_and_replace_in_scripts",
+    # ── NEW v0.6: DataModel tools ──────────────────────────────────────────
+    "roblox_get_place_info":       "get_place_info",
+    "roblox_set_lighting":         "set_lighting",
+    "roblox_get_workspace_info":   "get_workspace_info",
+    "roblox_get_team_list":        "get_team_list",
+    "roblox_get_lighting_effects": "get_lighting_effects",
+}
 
-    if name not in tool_to_job:
-        return None
 
-    job_type = tool_to_job[name]
-    job_args = dict(arguments)
+def _build_job(job_type, arguments):
+    job_id = f"job_{_JOB_ID_PREFIX}{next(_job_counter):08x}"
+
+    # Only the code-running tools rewrite their arguments; everything else
+    # (including large bulk payloads) is passed through without a copy.
     if job_type in {"run_code", "run_script_in_play_mode"}:
+        job_args = dict(arguments)
         if not job_args.get("code"):
             job_args["code"] = job_args.get("script") or job_args.get("source")
+    else:
+        job_args = arguments
     return {
         "job_id": job_id,
         "type": job_type,
@@ -367,7 +753,7 @@ def _get_connection_status(job_queue, arguments):
     last_seen = job_queue.get_last_seen(client_id)
     if last_seen is None:
         return {"connected": False, "client_id": client_id}
-    age = time.time() - last_seen
+    age = time.monotonic() - last_seen
     return {
         "connected": age < 15,
         "client_id": client_id,
@@ -414,40 +800,43 @@ def _ref_schema(extra_props=None, required=None):
     return schema
 
 
+# Schemas shared verbatim by many tools. Built once and referenced from every
+# tool entry rather than re-created per tool; nothing mutates them.
+_CLIENT_ONLY_SCHEMA = {
+    "type": "object",
+    "properties": {"client_id": {"type": "string"}},
+}
+_REF_SCHEMA = _ref_schema()
+
+
 def _build_tools():
     return [
         # -- Meta ---------------------------------------------------------------
         {
             "name": "studio_get_connection_status",
             "description": "Check if the Roblox Studio plugin is connected to the bridge.",
-            "inputSchema": {
-                "type": "object",
-                "properties": {"client_id": {"type": "string"}},
-            },
+            "inputSchema": _CLIENT_ONLY_SCHEMA,
         },
         # -- Instance tools -----------------------------------------------------
         {
             "name": "roblox_list_services",
             "description": "List top-level services in the current place.",
-            "inputSchema": {
-                "type": "object",
-                "properties": {"client_id": {"type": "string"}},
-            },
+            "inputSchema": _CLIENT_ONLY_SCHEMA,
         },
         {
             "name": "roblox_get_children",
             "description": "Get the direct children of an instance.",
-            "inputSchema": _ref_schema(),
+            "inputSchema": _REF_SCHEMA,
         },
         {
             "name": "roblox_get_descendants",
             "description": "Get all descendants of an instance. Can be large - prefer get_tree for an overview.",
-            "inputSchema": _ref_schema(),
+            "inputSchema": _REF_SCHEMA,
         },
         {
             "name": "roblox_get_instance",
             "description": "Get info (name, className, fullName) for a single instance.",
-            "inputSchema": _ref_schema(),
+            "inputSchema": _REF_SCHEMA,
         },
         {
             "name": "roblox_find_instances",
@@ -499,7 +888,7 @@ def _build_tools():
         {
             "name": "roblox_delete_instance",
             "description": "Destroy an instance and all its descendants. Undoable via Ctrl+Z.",
-            "inputSchema": _ref_schema(),
+            "inputSchema": _REF_SCHEMA,
         },
         {
             "name": "roblox_clone_instance",
@@ -534,16 +923,13 @@ def _build_tools():
         {
             "name": "roblox_select_instance",
             "description": "Select an instance in the Studio Explorer (for visibility).",
-            "inputSchema": _ref_schema(),
+            "inputSchema": _REF_SCHEMA,
         },
         # -- Selection ----------------------------------------------------------
         {
             "name": "roblox_get_selection",
             "description": "Get the instances currently selected in the Studio Explorer.",
-            "inputSchema": {
-                "type": "object",
-                "properties": {"client_id": {"type": "string"}},
-            },
+            "inputSchema": _CLIENT_ONLY_SCHEMA,
         },
         # -- Property / Attribute tools -----------------------------------------
         {
@@ -583,7 +969,7 @@ def _build_tools():
         {
             "name": "roblox_get_attributes",
             "description": "Get all custom attributes on an instance. Returns rich type objects for complex attribute values.",
-            "inputSchema": _ref_schema(),
+            "inputSchema": _REF_SCHEMA,
         },
         {
             "name": "roblox_set_attributes",
@@ -597,7 +983,7 @@ def _build_tools():
         {
             "name": "roblox_get_tags",
             "description": "Get all CollectionService tags on an instance.",
-            "inputSchema": _ref_schema(),
+            "inputSchema": _REF_SCHEMA,
         },
         {
             "name": "roblox_add_tag",
@@ -622,7 +1008,7 @@ def _build_tools():
                 "Read the full Source of a Script/LocalScript/ModuleScript. "
                 "For large scripts prefer get_script_lines to read a specific range."
             ),
-            "inputSchema": _ref_schema(),
+            "inputSchema": _REF_SCHEMA,
         },
         {
             "name": "roblox_write_script",
@@ -690,7 +1076,7 @@ def _build_tools():
         {
             "name": "roblox_get_script_functions",
             "description": "List all function definitions in a script with line numbers and types.",
-            "inputSchema": _ref_schema(),
+            "inputSchema": _REF_SCHEMA,
         },
         {
             "name": "roblox_search_across_scripts",
@@ -763,10 +1149,7 @@ def _build_tools():
         {
             "name": "roblox_get_studio_mode",
             "description": "Query the current Studio run mode and whether play mode is active.",
-            "inputSchema": {
-                "type": "object",
-                "properties": {"client_id": {"type": "string"}},
-            },
+            "inputSchema": _CLIENT_ONLY_SCHEMA,
         },
         {
             "name": "roblox_run_script_in_play_mode",
@@ -791,15 +1174,12 @@ def _build_tools():
         {
             "name": "roblox_get_open_scripts",
             "description": "List all scripts currently open in the Studio script editor.",
-            "inputSchema": {
-                "type": "object",
-                "properties": {"client_id": {"type": "string"}},
-            },
+            "inputSchema": _CLIENT_ONLY_SCHEMA,
         },
         {
             "name": "roblox_close_script",
             "description": "Close a script's tab in the Studio script editor.",
-            "inputSchema": _ref_schema(),
+            "inputSchema": _REF_SCHEMA,
         },
         # -- ChangeHistoryService -----------------------------------------------
         {
@@ -829,7 +1209,7 @@ def _build_tools():
                 "Read ALL properties from an instance using ReflectionService. "
                 "Returns every readable, non-deprecated property with its current value."
             ),
-            "inputSchema": _ref_schema(),
+            "inputSchema": _REF_SCHEMA,
         },
 
         # ── NEW v0.6: Terrain tools ────────────────────────────────────────────
@@ -913,7 +1293,7 @@ def _build_tools():
             ),
             "inputSchema": {
                 "type": "object",
-                "properties": dict(_REGION_PROPS),
+                "properties": _REGION_PROPS,
                 "required": ["regionMin", "regionMax"],
             },
         },
@@ -1050,10 +1430,7 @@ def _build_tools():
                 "PlaceVersion, gravity, StreamingEnabled, all Lighting service properties, "
                 "and a summary of child counts for each major service."
             ),
-            "inputSchema": {
-                "type": "object",
-                "properties": {"client_id": {"type": "string"}},
-            },
+            "inputSchema": _CLIENT_ONLY_SCHEMA,
         },
         {
             "name": "roblox_set_lighting",
@@ -1081,18 +1458,12 @@ def _build_tools():
                 "Return key Workspace-level settings useful for level design: "
                 "Gravity, StreamingEnabled, streaming radii, wind settings, and the current camera CFrame."
             ),
-            "inputSchema": {
-                "type": "object",
-                "properties": {"client_id": {"type": "string"}},
-            },
+            "inputSchema": _CLIENT_ONLY_SCHEMA,
         },
         {
             "name": "roblox_get_team_list",
             "description": "Return all teams in the Teams service with their BrickColor and AutoAssignable setting.",
-            "inputSchema": {
-                "type": "object",
-                "properties": {"client_id": {"type": "string"}},
-            },
+            "inputSchema": _CLIENT_ONLY_SCHEMA,
         },
         {
             "name": "roblox_get_lighting_effects",
@@ -1100,24 +1471,107 @@ def _build_tools():
                 "Return all post-processing and lighting effects under the Lighting service "
                 "(Bloom, DepthOfField, ColorCorrection, SunRays, etc.) including their key property values."
             ),
-            "inputSchema": {
-                "type": "object",
-                "properties": {"client_id": {"type": "string"}},
-            },
+            "inputSchema": _CLIENT_ONLY_SCHEMA,
         },
     ]
 
 
-def main():
+# ---------------------------------------------------------------------------
+# Argument validation
+# ---------------------------------------------------------------------------
+
+def _compile_properties(properties):
+    """Compile an inputSchema's properties into a `check(value, path)` function.
+
+    Only the batch arguments (arrays of objects such as `instances`,
+    `operations` and `patches`) are enforced: the plugin iterates those as
+    lists and caps their length, so a wrong shape or an oversized batch is
+    rejected here without a round trip. Everything else is left to the
+    plugin, which resolves aliases and coerces values itself (vectors may
+    be `{x, y, z}` or `[x, y, z]`). Returns None when there is nothing to
+    check.
+    """
+    batches = [
+        (key, sub.get("maxItems"))
+        for key, sub in properties.items()
+        if sub.get("type") == "array" and sub.get("items", {}).get("type") == "object"
+    ]
+    if not batches:
+        return None
+
+    def check(value, path):
+        for key, max_items in batches:
+            items = value.get(key)
+            if items is None:
+                continue
+            if not isinstance(items, list):
+                raise ValueError(f"{path}.{key} must be an array")
+            if max_items is not None and len(items) > max_items:
+                raise ValueError(f"{path}.{key} has more than {max_items} items")
+
+    return check
+
+
+# The tool list is static for the life of the process: build it and the
+# whole tools/list response once, so serving it only has to encode the id.
+_TOOLS = _build_tools()
+_TOOLS_LIST_PREFIX = b'{"jsonrpc": "2.0", "id": '
+_TOOLS_LIST_SUFFIX = b', "result": ' + _json_dumps({"tools": _TOOLS}) + b"}"
+# The arguments object itself is type-checked in _call_tool; only tools
+# with batch arguments get a validator, so most calls skip validation.
+_VALIDATORS = {
+    name: check
+    for name, check in (
+        (t["name"], _compile_properties(t["inputSchema"].get("properties", {})))
+        for t in _TOOLS
+    )
+    if check is not None
+}
+
+
+# Defaults for every command-line option, shared by the argparse parser
+# and the no-flags fast path below.
+_DEFAULT_ARGS = {
+    "http_bind": DEFAULT_HTTP_BIND,
+    "http_port": DEFAULT_HTTP_PORT,
+    "poll_timeout": DEFAULT_POLL_TIMEOUT_SEC,
+    "job_timeout": DEFAULT_JOB_TIMEOUT_SEC,
+    "quiet": False,
+    "no_validate_input": False,
+}
+
+
+def _parse_args():
+    # MCP clients normally launch the server with no flags; skip importing
+    # and building argparse entirely in that case.
+    if len(sys.argv) == 1:
+        return SimpleNamespace(**_DEFAULT_ARGS)
+
+    import argparse
+
     parser = argparse.ArgumentParser(description="Roblox Studio MCP bridge")
-    parser.add_argument("--http-bind", default=DEFAULT_HTTP_BIND)
-    parser.add_argument("--http-port", type=int, default=DEFAULT_HTTP_PORT)
-    parser.add_argument("--poll-timeout", type=int, default=DEFAULT_POLL_TIMEOUT_SEC)
-    parser.add_argument("--job-timeout", type=int, default=DEFAULT_JOB_TIMEOUT_SEC)
+    parser.add_argument("--http-bind")
+    parser.add_argument("--http-port", type=int)
+    parser.add_argument("--poll-timeout", type=int)
+    parser.add_argument("--job-timeout", type=int)
     parser.add_argument("--quiet", action="store_true")
-    args = parser.parse_args()
+    parser.add_argument("--no-validate-input", action="store_true")
+    parser.set_defaults(**_DEFAULT_ARGS)
+    return parser.parse_args()
+
+
+def main():
+    args = _parse_args()
 
     job_queue = JobQueue()
+    threading.stack_size(HANDLER_THREAD_STACK_SIZE)
+
+    # Everything allocated so far (tool schemas, lookup tables, imported
+    # modules) lives for the whole process: move it out of the collector's
+    # view, and let bulk payloads allocate more before a gen-0 pass runs.
+    gc.collect()
+    gc.freeze()
+    gc.set_threshold(*GC_THRESHOLDS)
 
     bind_display = args.http_bind or "0.0.0.0"
     print(
@@ -1140,7 +1594,7 @@ def main():
     thread = threading.Thread(target=http_server.serve_forever, daemon=True)
     thread.start()
 
-    mcp = McpServer(job_queue, args.job_timeout)
+    mcp = McpServer(job_queue, args.job_timeout, not args.no_validate_input)
     try:
         mcp.run()
     except KeyboardInterrupt:
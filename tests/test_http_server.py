@@ -0,0 +1,128 @@
+import os
+import socket
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "server"))
+
+import roblox_mcp_server as server  # noqa: E402
+
+
+def _request(sock, path):
+    sock.sendall(b"GET %s HTTP/1.1\r\nHost: localhost\r\n\r\n" % path.encode())
+    data = b""
+    while b"\r\n\r\n" not in data:
+        chunk = sock.recv(4096)
+        if not chunk:
+            break
+        data += chunk
+    head, _, body = data.partition(b"\r\n\r\n")
+    headers = head.decode("latin-1").split("\r\n")
+    length = 0
+    for line in headers[1:]:
+        name, _, value = line.partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    while len(body) < length:
+        chunk = sock.recv(4096)
+        if not chunk:
+            break
+        body += chunk
+    return headers, body
+
+
+class BridgeServerTests(unittest.TestCase):
+    def setUp(self):
+        self.httpd = server.RobloxBridgeHttpServer(
+            ("127.0.0.1", 0),
+            server.RobloxBridgeHttpHandler,
+            server.JobQueue(),
+            1,
+            True,
+        )
+        self.port = self.httpd.server_address[1]
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        self.sockets = []
+
+    def tearDown(self):
+        for sock in self.sockets:
+            sock.close()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def connect(self):
+        sock = socket.create_connection(("127.0.0.1", self.port), timeout=5)
+        self.sockets.append(sock)
+        return sock
+
+    def test_keep_alive(self):
+        sock = self.connect()
+        for _ in range(3):
+            headers, _ = _request(sock, "/health")
+            self.assertEqual(headers[0], "HTTP/1.1 200 OK")
+            self.assertNotIn("Connection: close", headers)
+
+    def test_idle_connections_do_not_block_new_requests(self):
+        # Every pooled worker ends up holding an idle kept-alive connection.
+        for _ in range(server.MAX_HANDLER_THREADS):
+            headers, _ = _request(self.connect(), "/health")
+            self.assertEqual(headers[0], "HTTP/1.1 200 OK")
+
+        sock = self.connect()
+        sock.settimeout(2)
+        headers, body = _request(sock, "/ping")
+        self.assertEqual(headers[0], "HTTP/1.1 200 OK")
+        self.assertIn(b'"ok"', body)
+        # Served outside the pool, so it is not kept alive.
+        self.assertIn("Connection: close", headers)
+        self.assertEqual(sock.recv(1), b"")
+
+    def test_long_poll_does_not_block_other_requests(self):
+        job_queue = self.httpd.job_queue
+        self.httpd.poll_timeout_sec = 5
+        results = []
+        poller = threading.Thread(
+            target=lambda: results.append(
+                _request(self.connect(), "/poll?client_id=studio&max_jobs=8")
+            )
+        )
+        poller.start()
+
+        # While the poll is held, another connection is served and its
+        # result reaches the queue.
+        sock = self.connect()
+        body = b'{"job_id": "job_x", "ok": true}'
+        sock.sendall(
+            b"POST /result HTTP/1.1\r\nHost: localhost\r\n"
+            b"Content-Length: %d\r\n\r\n%s" % (len(body), body)
+        )
+        self.assertTrue(sock.recv(4096).startswith(b"HTTP/1.1 200"))
+        self.assertEqual(job_queue.wait_for_result("job_x", 5)["ok"], True)
+
+        job_queue.enqueue("studio", {"job_id": "job_1", "type": "undo", "args": {}})
+        poller.join(5)
+        self.assertFalse(poller.is_alive())
+        headers, body = results[0]
+        self.assertEqual(headers[0], "HTTP/1.1 200 OK")
+        self.assertIn(b'"job_1"', body)
+
+    def test_unknown_post_closes_connection(self):
+        sock = self.connect()
+        sock.sendall(
+            b"POST /nope HTTP/1.1\r\nHost: localhost\r\n"
+            b"Content-Length: 2\r\n\r\n{}"
+        )
+        data = b""
+        while True:
+            chunk = sock.recv(4096)
+            if not chunk:
+                break
+            data += chunk
+        self.assertTrue(data.startswith(b"HTTP/1.1 404"))
+        self.assertIn(b"\r\nConnection: close\r\n", data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "server"))
+
+import roblox_mcp_server as server  # noqa: E402
+
+
+def _job(job_id):
+    return {"job_id": job_id, "type": "undo", "args": {}}
+
+
+class JobQueueTests(unittest.TestCase):
+    def setUp(self):
+        self.queue = server.JobQueue()
+
+    def test_jobs_are_kept_per_client(self):
+        self.queue.enqueue("a", _job("a1"))
+        self.queue.enqueue("b", _job("b1"))
+        self.queue.enqueue("a", _job("a2"))
+
+        self.assertEqual(self.queue.wait_for_job("a", 0)["job_id"], "a1")
+        self.assertEqual(self.queue.wait_for_job("b", 0)["job_id"], "b1")
+        self.assertEqual(self.queue.wait_for_job("a", 0)["job_id"], "a2")
+        self.assertIsNone(self.queue.wait_for_job("a", 0))
+        self.assertIsNone(self.queue.wait_for_job("b", 0))
+
+    def test_wait_for_job_wakes_on_enqueue(self):
+        got = []
+        waiter = threading.Thread(
+            target=lambda: got.append(self.queue.wait_for_job("a", 5))
+        )
+        waiter.start()
+        time.sleep(0.05)
+        # A job for another client must not wake or satisfy the waiter.
+        self.queue.enqueue("b", _job("b1"))
+        self.queue.enqueue("a", _job("a1"))
+        waiter.join(5)
+        self.assertFalse(waiter.is_alive())
+        self.assertEqual(got[0]["job_id"], "a1")
+        self.assertEqual(self.queue.wait_for_job("b", 0)["job_id"], "b1")
+
+    def test_wait_for_job_times_out(self):
+        start = time.monotonic()
+        self.assertIsNone(self.queue.wait_for_job("a", 0.1))
+        self.assertGreaterEqual(time.monotonic() - start, 0.1)
+
+    def test_drain(self):
+        for i in range(5):
+            self.queue.enqueue("a", _job(f"a{i}"))
+        self.queue.enqueue("b", _job("b0"))
+
+        jobs = self.queue.drain("a", 3)
+        self.assertEqual([j["job_id"] for j in jobs], ["a0", "a1", "a2"])
+        jobs = self.queue.drain("a", 10)
+        self.assertEqual([j["job_id"] for j in jobs], ["a3", "a4"])
+        self.assertEqual(self.queue.drain("a", 10), [])
+        self.assertEqual(self.queue.drain("unknown", 10), [])
+        self.assertEqual([j["job_id"] for j in self.queue.drain("b", 10)], ["b0"])
+
+    def test_cancel_job(self):
+        self.queue.enqueue("a", _job("a1"))
+        self.queue.enqueue("a", _job("a2"))
+        self.queue.enqueue("b", _job("b1"))
+
+        self.assertTrue(self.queue.cancel_job("a", "a1"))
+        self.assertFalse(self.queue.cancel_job("a", "a1"))
+        self.assertEqual(self.queue.wait_for_job("a", 0)["job_id"], "a2")
+        # Already handed out: nothing left to cancel.
+        self.assertFalse(self.queue.cancel_job("a", "a2"))
+        self.assertEqual(self.queue.wait_for_job("b", 0)["job_id"], "b1")
+
+    def test_result_stored_before_wait_is_returned(self):
+        self.queue.store_result("job1", {"job_id": "job1", "ok": True})
+        result = self.queue.wait_for_result("job1", 0)
+        self.assertEqual(result, {"job_id": "job1", "ok": True})
+        self.assertIsNone(self.queue.wait_for_result("job1", 0))
+
+    def test_wait_for_result_wakes_on_store(self):
+        threading.Timer(
+            0.05, self.queue.store_result, ("job1", {"ok": True})
+        ).start()
+        self.assertEqual(self.queue.wait_for_result("job1", 5), {"ok": True})
+
+    def test_wait_for_result_times_out(self):
+        self.assertIsNone(self.queue.wait_for_result("job1", 0.05))
+
+    def test_is_connected(self):
+        self.assertFalse(self.queue.is_connected("a"))
+        self.assertIsNone(self.queue.get_last_seen("a"))
+        self.queue.mark_seen("a")
+        self.assertTrue(self.queue.is_connected("a"))
+        self.assertFalse(self.queue.is_connected("a", max_age=0))
+        self.assertFalse(self.queue.is_connected("b"))
+
+
+if __name__ == "__main__":
+    unittest.main()
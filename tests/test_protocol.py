@@ -0,0 +1,92 @@
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "server"))
+
+import roblox_mcp_server as server  # noqa: E402
+
+
+class QueryParamTests(unittest.TestCase):
+    def test_reads_value(self):
+        query = "client_id=studio&max_jobs=8"
+        self.assertEqual(server._query_param(query, "client_id"), "studio")
+        self.assertEqual(server._query_param(query, "max_jobs"), "8")
+
+    def test_default(self):
+        self.assertIsNone(server._query_param("", "client_id"))
+        self.assertIsNone(server._query_param("other=1", "client_id"))
+        self.assertEqual(server._query_param("other=1", "max_jobs", "1"), "1")
+
+    def test_matches_whole_key_only(self):
+        query = "my_client_id=x&client_id=y"
+        self.assertEqual(server._query_param(query, "client_id"), "y")
+        self.assertIsNone(server._query_param("my_client_id=x", "client_id"))
+        self.assertIsNone(server._query_param("client_idx=x", "client_id"))
+
+    def test_first_value_wins(self):
+        self.assertEqual(server._query_param("a=1&a=2", "a"), "1")
+
+    def test_empty_value(self):
+        self.assertEqual(server._query_param("client_id=&x=1", "client_id"), "")
+
+    def test_percent_decoding(self):
+        self.assertEqual(
+            server._query_param("client_id=my%20studio%26co", "client_id"),
+            "my studio&co",
+        )
+        self.assertEqual(server._query_param("client_id=a+b", "client_id"), "a b")
+
+    def test_semicolon_is_not_a_separator(self):
+        self.assertEqual(server._query_param("a=1;b=2", "a"), "1;b=2")
+        self.assertIsNone(server._query_param("a=1;b=2", "b"))
+
+
+class SplitPathTests(unittest.TestCase):
+    def test_split_path(self):
+        self.assertEqual(server._split_path("/poll?client_id=x"), ("/poll", "client_id=x"))
+        self.assertEqual(server._split_path("/health"), ("/health", ""))
+
+
+class ReadMessageTests(unittest.TestCase):
+    def setUp(self):
+        self.mcp = server.McpServer(server.JobQueue(), 0)
+
+    def read_all(self, data):
+        stdin = io.BytesIO(data)
+        messages = []
+        while True:
+            body = self.mcp._read_message(stdin)
+            if body is None:
+                return messages
+            messages.append(bytes(body))
+
+    def test_newline_delimited(self):
+        messages = self.read_all(b'{"id": 1}\n\n{"id": 2}\r\n')
+        self.assertEqual(messages, [b'{"id": 1}', b"", b'{"id": 2}'])
+        self.assertFalse(self.mcp.framed)
+
+    def test_content_length_framing(self):
+        first = b'{"id": 1,\n "method": "x"}'
+        second = b'{"id": 2}'
+        data = (
+            b"Content-Length: %d\r\n\r\n%s" % (len(first), first)
+            + b"content-length: %d\r\nContent-Type: application/json\r\n\r\n%s"
+            % (len(second), second)
+        )
+        self.assertEqual(self.read_all(data), [first, second])
+        self.assertTrue(self.mcp.framed)
+
+    def test_bad_content_length_is_skipped(self):
+        for header in (b"Content-Length: nope", b"Content-Length: -1"):
+            stdin = io.BytesIO(header + b'\r\n\r\n{"id": 1}\n')
+            self.assertEqual(self.mcp._read_message(stdin), b"")
+            self.assertFalse(self.mcp.framed)
+
+    def test_eof_inside_headers(self):
+        self.assertEqual(self.read_all(b"Content-Length: 5\r\n"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "server"))
+
+import roblox_mcp_server as server  # noqa: E402
+
+
+class ValidationTests(unittest.TestCase):
+    def setUp(self):
+        self.mcp = server.McpServer(server.JobQueue(), 0)
+
+    def assertForwarded(self, name, arguments):
+        # With no plugin connected, arguments that pass validation get as
+        # far as the connection check.
+        result = self.mcp._call_tool(name, arguments)
+        text = result["content"][0]["text"]
+        self.assertTrue(result.get("isError"))
+        self.assertIn("not connected", text)
+
+    def assertRejected(self, name, arguments, message):
+        result = self.mcp._call_tool(name, arguments)
+        text = result["content"][0]["text"]
+        self.assertTrue(result.get("isError"))
+        self.assertIn(message, text)
+
+    def test_vector_arrays_are_forwarded(self):
+        self.assertForwarded(
+            "roblox_terrain_clear_region",
+            {"regionMin": [0, 0, 0], "regionMax": [4, 4, 4]},
+        )
+        self.assertForwarded(
+            "roblox_terrain_fill_block",
+            {"cframe": [0, 10, 0], "size": [8, 2, 8], "material": "Grass"},
+        )
+        self.assertForwarded(
+            "roblox_terrain_fill_ball", {"center": [0, 0, 0], "radius": "4"}
+        )
+
+    def test_code_alias_is_forwarded(self):
+        self.assertForwarded("roblox_run_code", {"script": "print(1)"})
+
+    def test_batch_must_be_array(self):
+        self.assertRejected(
+            "roblox_bulk_create_instances",
+            {"instances": {"className": "Part"}},
+            "arguments.instances must be an array",
+        )
+
+    def test_batch_limit(self):
+        self.assertRejected(
+            "roblox_bulk_set_properties",
+            {"operations": [{}] * 201},
+            "arguments.operations has more than 200 items",
+        )
+
+    def test_arguments_must_be_object(self):
+        self.assertRejected(
+            "roblox_undo", [1], "arguments must be of type object"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()